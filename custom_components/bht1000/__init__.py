@@ -1,12 +1,17 @@
 """BHT-1000 thermostat integration."""
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST
-from homeassistant.core import HomeAssistant
+from typing import Final, Tuple
+
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.const import CONF_HOST, EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.typing import ConfigType
 
 from .bht1000 import BHT1000
-from .const import CONTROLLER, DOMAIN, PORT
+from .const import CONTROLLER, COORDINATOR, DOMAIN, PORT
+from .coordinator import Bht1000Coordinator
+
+PLATFORMS: Final[Tuple[str, ...]] = ("climate", "lock")
 
 
 # pylint: disable=unused-argument
@@ -21,7 +26,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     Returns:
         The value indicates whether the setup succeeded.
     """
-    hass.data[DOMAIN] = {CONTROLLER: {}}
+    hass.data[DOMAIN] = {CONTROLLER: {}, COORDINATOR: {}}
     return True
 
 
@@ -36,19 +41,59 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     Returns:
         The value indicates whether the setup succeeded.
     """
-    if config_entry.data[CONF_HOST] not in hass.data[DOMAIN][CONTROLLER]:
-        hass.data[DOMAIN][CONTROLLER][config_entry.data[CONF_HOST]] = BHT1000(
-            config_entry.data[CONF_HOST], PORT
-        )
-
-    hass.async_create_task(
-        hass.config_entries.async_forward_entry_setups(
-            config_entry,
-            (
-                "climate",
-                "lock",
-            ),
-        )
+    controllers = hass.data[DOMAIN][CONTROLLER]
+    host = config_entry.data[CONF_HOST]
+    if host not in controllers:
+        controllers[host] = BHT1000(host, PORT)
+    controller = controllers[host]
+
+    @callback
+    def close_controller(_: Event) -> None:
+        """Closes the connection to the thermostat when Home Assistant stops."""
+        controller.close()
+
+    config_entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, close_controller)
     )
 
+    coordinators = hass.data[DOMAIN][COORDINATOR]
+    if host not in coordinators:
+        coordinator = Bht1000Coordinator(hass, controller, host)
+        await coordinator.async_config_entry_first_refresh()
+        coordinators[host] = coordinator
+
+    await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
+
+    return True
+
+
+async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
+    """
+    Unload the climates of the config entry.
+
+    The connection to the thermostat is closed unless
+    another loaded config entry uses the same host.
+
+    Args:
+        hass: The Home Assistant instance.
+        config_entry: The config entry to unload.
+
+    Returns:
+        The value indicates whether the unload succeeded.
+    """
+    if not await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS):
+        return False
+
+    host = config_entry.data[CONF_HOST]
+    if not any(
+        entry.entry_id != config_entry.entry_id
+        and entry.state is ConfigEntryState.LOADED
+        and entry.data[CONF_HOST] == host
+        for entry in hass.config_entries.async_entries(DOMAIN)
+    ):
+        hass.data[DOMAIN][COORDINATOR].pop(host, None)
+        controller = hass.data[DOMAIN][CONTROLLER].pop(host, None)
+        if controller is not None:
+            controller.close()
+
     return True
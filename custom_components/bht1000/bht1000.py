@@ -3,8 +3,11 @@ import asyncio
 import binascii
 import datetime
 import logging
+import socket
+import struct
 from dataclasses import dataclass
-from typing import Final, Union
+from time import monotonic
+from typing import Final, Tuple, Union
 
 import async_timeout
 
@@ -19,7 +22,36 @@ FLAG_LOCK = 0x04
 FLAG_MANUAL_MODE = 0x08
 FLAG_POWER = 0x10
 
-@dataclass
+# The layout of every frame: command, id0, id1, data0-3 and checksum.
+_FRAME_STRUCT: Final[struct.Struct] = struct.Struct("8B")
+
+# The data0 flags of the set all data command,
+# indexed by locked << 2 | manual << 1 | power.
+_DATA0_FLAGS: Final[Tuple[int, ...]] = tuple(
+    (FLAG_LOCK if locked else 0)
+    | (FLAG_MANUAL_MODE if manual else 0)
+    | (FLAG_POWER if power else 0)
+    for locked in (False, True)
+    for manual in (False, True)
+    for power in (False, True)
+)
+
+READ_STATUS_COMMAND = 0xA0
+
+# An identical command acknowledged within this many seconds is not resent.
+DUPLICATE_COMMAND_WINDOW = 2.0
+
+# A status received within this many seconds is reused instead of read again.
+STATUS_MAX_AGE = 1.0
+
+# TCP keepalive settings of the connection: the first probe is sent after
+# KEEPALIVE_IDLE seconds of silence, then every KEEPALIVE_INTERVAL seconds,
+# and the peer is considered dead after KEEPALIVE_COUNT unanswered probes.
+KEEPALIVE_IDLE = 10
+KEEPALIVE_INTERVAL = 5
+KEEPALIVE_COUNT = 3
+
+@dataclass(slots=True, eq=False, repr=False)
 # pylint: disable=too-many-instance-attributes
 class Payload:
     """
@@ -66,6 +98,8 @@ class Payload:
 class IncomingPayload(Payload):
     """Represents an incoming message payload."""
 
+    __slots__ = ("payload",)
+
     def __init__(self, payload: bytes):
         """
         Initialize a new instance of `IncomingPayload` class.
@@ -73,22 +107,18 @@ class IncomingPayload(Payload):
         Args:
             payload: The received bytes from the device.
         """
-        super().__init__(
-            int(payload[:2], 16),
-            int(payload[2:4], 16),
-            int(payload[4:6], 16),
-            int(payload[6:8], 16),
-            int(payload[8:10], 16),
-            int(payload[10:12], 16),
-            int(payload[12:14], 16),
-            int(payload[14:16], 16),
-        )
+        super().__init__(*_FRAME_STRUCT.unpack_from(payload))
         self.payload = payload
 
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.payload[:8].hex()})"
+
 
 class StatusPayload(IncomingPayload):
     """Represents a status message incoming message payload."""
 
+    __slots__ = ()
+
     def is_valid(self) -> bool:
         """Gets the value indicates whether the message is valid."""
         return self.command == 0x50 and self.id0 == 0x01 and self.id1 == 0x01
@@ -115,16 +145,18 @@ class StatusPayload(IncomingPayload):
 
     def get_setpoint(self) -> float:
         """Gets the current set point value of the device."""
-        return float(self.data2) / 2.0
+        return self.data2 * 0.5
 
     def get_temperature(self) -> float:
         """Gets the current temperature returned by the device."""
-        return float(self.data3) / 2.0
+        return self.data3 * 0.5
 
 
 class OutgoingPayload(Payload):
     """Represents an outgoing message payload."""
 
+    __slots__ = ("_frame",)
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
@@ -145,6 +177,7 @@ class OutgoingPayload(Payload):
             data2: The data2 field of the payload.
             data3: The data3 field of the payload.
         """
+        checksum = (command + ID0 + ID1 + data0 + data1 + data2 + data3) & 0xFF ^ 0xA5
         super().__init__(
             command,
             ID0,
@@ -153,99 +186,56 @@ class OutgoingPayload(Payload):
             data1,
             data2,
             data3,
-            self.__calculate_checksum(command, ID0, ID1, data0, data1, data2, data3),
+            checksum,
+        )
+        self._frame: Final[bytes] = _FRAME_STRUCT.pack(
+            command, ID0, ID1, data0, data1, data2, data3, checksum
         )
 
-    # pylint: disable=too-many-arguments
-    @classmethod
-    def __calculate_checksum(
-        cls,
-        command: int,
-        id0: int,
-        id1: int,
-        data0: int,
-        data1: int,
-        data2: int,
-        data3: int,
-    ):
-        """
-        Calculates the checksum of the payload.
-
-        Args:
-            command: The command field of the payload.
-            id0: The id0 field of the payload.
-            id1: The id1 field of the payload.
-            data0: The data0 field of the payload.
-            data1: The data1 field of the payload.
-            data2: The data2 field of the payload.
-            data3: The data3 field of the payload.
-        """
-        return (command + id0 + id1 + data0 + data1 + data2 + data3) & 0xFF ^ 0xA5
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._frame.hex()})"
 
-    def get_bytes_array(self) -> bytearray:
+    def get_bytes_array(self) -> bytes:
         """Returns the outgoing message as a byte array."""
-        result = bytearray()
-        result.append(self.command)
-        result.append(self.id0)
-        result.append(self.id1)
-        result.append(self.data0)
-        result.append(self.data1)
-        result.append(self.data2)
-        result.append(self.data3)
-        result.append(
-            self.__calculate_checksum(
-                self.command,
-                self.id0,
-                self.id1,
-                self.data0,
-                self.data1,
-                self.data2,
-                self.data3,
-            )
-        )
-        return result
+        return self._frame
 
 
 class ReadStatusCommandPayload(OutgoingPayload):
     """Represents a request to query the current state of the device."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Initialize a new instance of  `ReadStatusCommandPayload` class."""
-        super().__init__(0xA0, 0x00, 0x00, 0x00, 0x00)
+        super().__init__(READ_STATUS_COMMAND, 0x00, 0x00, 0x00, 0x00)
 
 
 class SetAllDataCommandPayload(OutgoingPayload):
     """Represents a request to set all parameters of the device."""
 
+    __slots__ = ()
+
     # pylint: disable=too-many-arguments
     def __init__(
-        self, mode: str, power: str, locked: bool, calibration: int, setpoint: float
+        self, mode: str, power: bool, locked: bool, calibration: int, setpoint: float
     ):
         """
         Initialize a new instance of `SetAllDataCommandPayload` class.
 
         Args:
             mode: The requested mode of the device.
-            power: The "on"/"off" value indicates whether the device should turned on.
-            lock: The "on"/"off" value indicates whether the device is locked.
+            power: The value indicates whether the device should turned on.
+            locked: The value indicates whether the device is locked.
             calibration: The calibration value to set on device.
             setpoint: The set point of the device.
         """
-        data0 = 0x00
         data3 = 0x00
 
-        if locked:
-            data0 = data0 | FLAG_LOCK
-
-        if mode == MANUAL_MODE:
-            data0 = data0 | FLAG_MANUAL_MODE
-
-        if power:
-            data0 = data0 | FLAG_POWER
-
         super().__init__(
             0xA1,
-            data0,
+            _DATA0_FLAGS[
+                bool(locked) << 2 | (mode == MANUAL_MODE) << 1 | bool(power)
+            ],
             calibration + 256 if (calibration < 0) else calibration,
             int(setpoint * 2.0),
             data3,
@@ -255,6 +245,8 @@ class SetAllDataCommandPayload(OutgoingPayload):
 class UnLockCommandPayload(OutgoingPayload):
     """Represents a command to unlock the device."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Initialize a new instance of  `UnLockCommandPayload` class."""
         super().__init__(0xA4, 0, 1, 1, 1)
@@ -263,6 +255,8 @@ class UnLockCommandPayload(OutgoingPayload):
 class LockCommandPayload(OutgoingPayload):
     """Represents a command to lock the device."""
 
+    __slots__ = ()
+
     def __init__(self):
         """Initialize a new instance of  `LockCommandPayload` class."""
         super().__init__(0xA4, 1, 1, 1, 1)
@@ -271,6 +265,8 @@ class LockCommandPayload(OutgoingPayload):
 class SetTimeCommandPayload(OutgoingPayload):
     """Represents a command to set the time on the device."""
 
+    __slots__ = ()
+
     def __init__(self, time: datetime.datetime):
         """
         Initialize a new instance of  `SetTimeCommandPayload` class.
@@ -281,6 +277,12 @@ class SetTimeCommandPayload(OutgoingPayload):
         super().__init__(0xA8, time.second, time.minute, time.hour, time.weekday() + 1)
 
 
+# The payloads below never change, so they are built only once.
+_READ_STATUS_COMMAND: Final[OutgoingPayload] = ReadStatusCommandPayload()
+_LOCK_COMMAND: Final[OutgoingPayload] = LockCommandPayload()
+_UNLOCK_COMMAND: Final[OutgoingPayload] = UnLockCommandPayload()
+
+
 class BHT1000:
     """Responsible for the communication with the BHT1000 thermostat."""
 
@@ -298,14 +300,22 @@ class BHT1000:
         """
         self._host: Final[str] = host
         self._port: Final[int] = port
-        self._hysteresis: Final[float] = hysteresis
+        self._half_hysteresis: Final[float] = hysteresis * 0.5
         self._current_temperature: Union[float, None] = None
         self._setpoint: Union[float, None] = None
-        self._power: Union[str, None] = None
+        self._power: Union[bool, None] = None
         self._mode: Union[str, None] = None
         self._locked: Union[bool, None] = None
         self._calibration: Union[int, None] = None
         self._idle: Union[bool, None] = None
+        self._valid: bool = False
+        self._last_frame: Union[bytes, None] = None
+        self._last_frame_time: float = 0.0
+        self._last_status_time: float = 0.0
+        self._lock: Final[asyncio.Lock] = asyncio.Lock()
+        self._read_lock: Final[asyncio.Lock] = asyncio.Lock()
+        self._reader: Union[asyncio.StreamReader, None] = None
+        self._writer: Union[asyncio.StreamWriter, None] = None
 
     async def check_host(self) -> bool:
         """
@@ -315,16 +325,11 @@ class BHT1000:
             The value indicates whether the thermostat is reachable.
         """
         try:
-            writer = (
-                await asyncio.wait_for(
-                    asyncio.open_connection(self._host, self._port), 10
-                )
-            )[1]
+            async with async_timeout.timeout(3):
+                writer = (await asyncio.open_connection(self._host, self._port))[1]
             writer.close()
-            await writer.wait_closed()
             return True
-        # pylint: disable=bare-except
-        except:
+        except (OSError, asyncio.TimeoutError):
             return False
 
     async def read_status(self) -> bool:
@@ -334,19 +339,26 @@ class BHT1000:
         Returns:
             The value indicates whether the update was successful.
         """
-        try:
-            _LOGGER.debug("read status (%s:%s)", self._host, self._port)
-            await self.__send_command(ReadStatusCommandPayload())
-            return True
-        # pylint: disable=broad-except
-        except Exception as error:
-            _LOGGER.error(error)
-            return False
+        # Concurrent reads wait for the one in flight and reuse its result.
+        async with self._read_lock:
+            if monotonic() - self._last_status_time < STATUS_MAX_AGE:
+                return True
+            try:
+                _LOGGER.debug("read status (%s:%s)", self._host, self._port)
+                return await self.__send_command(_READ_STATUS_COMMAND)
+            # pylint: disable=broad-except
+            except Exception as error:
+                _LOGGER.error(error)
+                return False
 
-    async def turn_on(self) -> bool:
+    async def turn_on(self, mode: Union[str, None] = None) -> bool:
         """
         Turns on the thermostat.
 
+        Args:
+            mode: The mode to set together with turning on.
+                  The current mode is kept if not specified.
+
         Returns:
             The value indicates whether the turning on was successful.
         """
@@ -354,7 +366,7 @@ class BHT1000:
             _LOGGER.debug("turn on (%s:%s)", self._host, self._port)
             return await self.__send_command(
                 SetAllDataCommandPayload(
-                    self._mode,
+                    self._mode if mode is None else mode,
                     True,
                     self._locked,
                     self._calibration,
@@ -414,7 +426,7 @@ class BHT1000:
         """
         if self.__is_data_valid():
             _LOGGER.debug("lock (%s:%s)", self._host, self._port)
-            return await self.__send_command(LockCommandPayload())
+            return await self.__send_command(_LOCK_COMMAND)
         return False
 
     async def unlock(self) -> bool:
@@ -426,7 +438,7 @@ class BHT1000:
         """
         if self.__is_data_valid():
             _LOGGER.debug("unlock (%s:%s)", self._host, self._port)
-            return await self.__send_command(UnLockCommandPayload())
+            return await self.__send_command(_UNLOCK_COMMAND)
         return False
 
     async def set_manual_mode(self) -> bool:
@@ -484,18 +496,16 @@ class BHT1000:
             return await self.__send_command(SetTimeCommandPayload(time))
         return False
 
+    def close(self) -> None:
+        """Closes the connection to the thermostat."""
+        _LOGGER.debug("close (%s:%s)", self._host, self._port)
+        self.__close_connection()
+
     def __is_data_valid(self) -> bool:
         """
         Gets the value indicates all state data stored in memory is valid.
         """
-        result = (
-            (self._mode is not None)
-            and (self._power is not None)
-            and (self._locked is not None)
-            and (self._calibration is not None)
-            and (self._setpoint is not None)
-        )
-        return result
+        return self._valid
 
     @property
     def current_temperature(self) -> Union[float, None]:
@@ -508,8 +518,8 @@ class BHT1000:
         return self._mode
 
     @property
-    def power(self) -> Union[str, None]:
-        """Gets the power state of the thermostat ("on"/"off")."""
+    def power(self) -> Union[bool, None]:
+        """Gets the value indicates whether the thermostat is turned on."""
         return self._power
 
     @property
@@ -539,72 +549,145 @@ class BHT1000:
         Returns:
             The value indicates whether the sending was successful.
         """
-        try:
-            reader, writer = await asyncio.wait_for(
-                asyncio.open_connection(self._host, self._port), 10
+        bytes_to_send = command.get_bytes_array()
+        if (
+            command.command != READ_STATUS_COMMAND
+            and bytes_to_send == self._last_frame
+            and monotonic() - self._last_frame_time < DUPLICATE_COMMAND_WINDOW
+        ):
+            _LOGGER.debug(
+                "skip resending acknowledged command (%s:%s)", self._host, self._port
             )
+            return True
 
-            async with async_timeout.timeout(3):
-                try:
-                    _LOGGER.debug("data to send %s", command)
-
-                    bytes_to_send = command.get_bytes_array()
-                    _LOGGER.debug(
-                        "bytes to send (%s:%s): %s",
-                        self._host,
-                        self._port,
-                        bytes_to_send,
-                    )
-                    writer.write(bytes_to_send)
-                    received_bytes = binascii.hexlify(await reader.read(64))
-                    _LOGGER.debug(
-                        "bytes received (%s:%s): %s",
-                        self._host,
-                        self._port,
-                        received_bytes,
-                    )
-                except asyncio.TimeoutError:
-                    return False
-                finally:
-                    writer.close()
-                    await writer.wait_closed()
-
-            if len(received_bytes) < 16:
-                return False
-
-            response = StatusPayload(received_bytes)
-            _LOGGER.debug("data received %s", response)
+        try:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("data to send %s", command)
+                _LOGGER.debug(
+                    "bytes to send (%s:%s): %s",
+                    self._host,
+                    self._port,
+                    bytes_to_send,
+                )
+            async with self._lock:
+                received_bytes = await self.__exchange(bytes_to_send)
+                response = StatusPayload(received_bytes)
+                if not response.is_valid():
+                    # The stream is out of step with the frames, start over.
+                    self.__close_connection()
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "bytes received (%s:%s): %s",
+                    self._host,
+                    self._port,
+                    binascii.hexlify(received_bytes),
+                )
+                _LOGGER.debug("data received %s", response)
             if not response.is_valid():
                 return False
 
-            was_idle = self._idle is True or self._idle is None
+            now = monotonic()
+            self._last_frame = bytes_to_send
+            self._last_frame_time = now
+            self._last_status_time = now
+
+            was_idle = self._idle is not False
             self._current_temperature = response.get_temperature()
             self._setpoint = response.get_setpoint()
             self._calibration = response.get_calibration()
             self._power = response.is_on()
             self._mode = response.get_mode()
             self._locked = response.is_locked()
+            self._valid = True
 
-            if self._power:
-                if (
-                    was_idle
-                    and self._current_temperature
-                    < self._setpoint - self._hysteresis / 2.0
-                ):
-                    self._idle = False
-                else:
-                    if (
-                        was_idle is False
-                        and self._current_temperature
-                        > self._setpoint + self._hysteresis / 2.0
-                    ):
-                        self._idle = True
-                    else:
-                        self._idle = was_idle
-            else:
-                self._idle = True
+            # Heating starts below the lower and stops above the upper threshold.
+            self._idle = not self._power or (
+                self._current_temperature >= self._setpoint - self._half_hysteresis
+                if was_idle
+                else self._current_temperature > self._setpoint + self._half_hysteresis
+            )
 
             return True
         # pylint: disable=broad-except
         except Exception:
             return False
+
+    async def __exchange(self, bytes_to_send: bytes) -> bytes:
+        """
+        Writes the frame to the thermostat and reads the response.
+
+        The connection is kept open between commands. If a reused connection
+        turns out to be closed by the thermostat, a new one is opened and the
+        frame is sent once more.
+
+        Args:
+            bytes_to_send: The frame to send.
+
+        Returns:
+            The bytes received from the thermostat.
+        """
+        reused = self._writer is not None and not self._writer.is_closing()
+        try:
+            return await self.__write_and_read(bytes_to_send)
+        except (OSError, asyncio.IncompleteReadError) as error:
+            # asyncio.TimeoutError is an OSError since Python 3.11. A thermostat
+            # which did not answer in time is not retried, resending would only
+            # wait again.
+            if not reused or isinstance(error, asyncio.TimeoutError):
+                raise
+        return await self.__write_and_read(bytes_to_send)
+
+    async def __write_and_read(self, bytes_to_send: bytes) -> bytes:
+        """
+        Writes the frame to the thermostat and reads the response,
+        opening a new connection when there is no usable one.
+
+        Args:
+            bytes_to_send: The frame to send.
+
+        Returns:
+            The bytes received from the thermostat.
+        """
+        if self._writer is None or self._writer.is_closing():
+            async with async_timeout.timeout(10):
+                self._reader, self._writer = await asyncio.open_connection(
+                    self._host, self._port
+                )
+            # Let the kernel detect a dead peer while the connection is idle.
+            sock = self._writer.get_extra_info("socket")
+            if sock is not None:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                for option, value in (
+                    ("TCP_KEEPIDLE", KEEPALIVE_IDLE),
+                    ("TCP_KEEPINTVL", KEEPALIVE_INTERVAL),
+                    ("TCP_KEEPCNT", KEEPALIVE_COUNT),
+                ):
+                    if hasattr(socket, option):
+                        sock.setsockopt(
+                            socket.IPPROTO_TCP, getattr(socket, option), value
+                        )
+
+        try:
+            async with async_timeout.timeout(3):
+                self._writer.write(bytes_to_send)
+                await self._writer.drain()
+                received_bytes = await self._reader.read(64)
+                if not received_bytes:
+                    raise ConnectionResetError("Connection closed by the thermostat.")
+                if len(received_bytes) < _FRAME_STRUCT.size:
+                    # The reply arrived split, wait for the rest of the frame.
+                    received_bytes += await self._reader.readexactly(
+                        _FRAME_STRUCT.size - len(received_bytes)
+                    )
+            return received_bytes
+        except BaseException:
+            # The state of the stream is unknown, never reuse it.
+            self.__close_connection()
+            raise
+
+    def __close_connection(self) -> None:
+        """Closes the connection to the thermostat if there is one."""
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = None
+        self._writer = None
@@ -45,7 +45,7 @@ class BHT1000ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 data = {
                     CONF_NAME: user_input[CONF_NAME],
                     CONF_HOST: user_input[CONF_HOST],
-                    CONF_MAC: user_input[CONF_MAC] if CONF_MAC in user_input else None,
+                    CONF_MAC: user_input.get(CONF_MAC),
                 }
                 return self.async_create_entry(
                     title=f"BHT-1000 WiFi Thermostat ({user_input[CONF_NAME]})",
@@ -1,11 +1,15 @@
 """Define BHT-1000 thermostat constants."""
 
+from datetime import timedelta
 from typing import Final
 
 
 CONTROLLER: Final[str] = "controller"
 """The key of the BHT1000 controller to store it in `hass.data`."""
 
+COORDINATOR: Final[str] = "coordinator"
+"""The key of the BHT1000 update coordinator to store it in `hass.data`."""
+
 DOMAIN: Final[str] = "bht1000"
 """The integration's domain."""
 
@@ -14,3 +18,6 @@ PORT: Final[int] = 8899
 
 SERVICE_SYNC_TIME: Final[str] = "sync_time"
 """The name of the time synchronization service."""
+
+UPDATE_INTERVAL: Final[timedelta] = timedelta(seconds=30)
+"""The interval of polling the status of the thermostat."""
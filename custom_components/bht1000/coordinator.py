@@ -0,0 +1,76 @@
+""" Module of BHT1000 update coordinator. """
+
+import logging
+from typing import Tuple, Union
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .bht1000 import BHT1000
+from .const import UPDATE_INTERVAL
+
+_LOGGER = logging.getLogger(__name__)
+
+
+Bht1000Status = Tuple[
+    Union[bool, None],
+    Union[str, None],
+    Union[bool, None],
+    Union[float, None],
+    Union[float, None],
+    Union[bool, None],
+]
+"""The power, mode, locked, current temperature, set point and idle state."""
+
+
+class Bht1000Coordinator(DataUpdateCoordinator[Bht1000Status]):
+    """
+    Polls the status of a BHT1000 thermostat once for all of its entities.
+
+    Listeners are only notified when the polled status differs from the previous one,
+    so commands must store the status they received with `async_set_controller_status`.
+    """
+
+    def __init__(self, hass: HomeAssistant, controller: BHT1000, host: str):
+        """
+        Initialize a new instance of `Bht1000Coordinator` class.
+
+        Args:
+            hass: The Home Assistant instance.
+            controller: The `BHT1000` instance which is used to communicate with the thermostat.
+            host: The host or the IP address of the thermostat.
+        """
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"BHT1000 ({host})",
+            update_interval=UPDATE_INTERVAL,
+            always_update=False,
+        )
+        self.controller = controller
+
+    async def _async_update_data(self) -> Bht1000Status:
+        """Reads the current status of the thermostat."""
+        if not await self.controller.read_status():
+            raise UpdateFailed("Failed to read the status of the thermostat.")
+        return self.__get_controller_status()
+
+    @callback
+    def async_set_controller_status(self) -> None:
+        """
+        Stores the status held by the controller, e.g. after a command
+        returned the new status of the thermostat, and notifies the listeners.
+        """
+        self.async_set_updated_data(self.__get_controller_status())
+
+    def __get_controller_status(self) -> Bht1000Status:
+        """Gets the status currently held by the controller."""
+        controller = self.controller
+        return (
+            controller.power,
+            controller.mode,
+            controller.locked,
+            controller.current_temperature,
+            controller.setpoint,
+            controller.idle,
+        )
@@ -8,56 +8,68 @@ from homeassistant.const import CONF_HOST, CONF_MAC, CONF_NAME
 from homeassistant.helpers import device_registry
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.core import HomeAssistant, callback
 
-from .bht1000 import BHT1000
-from .const import CONTROLLER, DOMAIN
+from .const import COORDINATOR, DOMAIN
+from .coordinator import Bht1000Coordinator
 
 _LOGGER = logging.getLogger(__name__)
 
 
 # pylint: disable=too-many-instance-attributes
-class Bht1000ChildLock(LockEntity):
+class Bht1000ChildLock(CoordinatorEntity[Bht1000Coordinator], LockEntity):
     """
     Represents a BHT1000 thermostat child lock.
     """
 
-    def __init__(self, controller: BHT1000, name: str, mac_address: str = None):
+    def __init__(
+        self, coordinator: Bht1000Coordinator, name: str, mac_address: str = None
+    ):
         """
-        Initialize a new instance of `Bht1000Device` class.
+        Initialize a new instance of `Bht1000ChildLock` class.
 
         Args:
-            controller: The `BHT1000` instance which is used to communicate with the thermostat.
+            coordinator: The coordinator which polls the status of the thermostat.
             name: The name of the thermostat
             mac_address: The MAC address of the thermostat.
         """
-        self._controller = controller
+        super().__init__(coordinator)
+        self._controller = coordinator.controller
         self._mac_address = mac_address
+        self._attr_is_locked = self._controller.locked
+        self._last_state = (self.available, self._attr_is_locked)
 
-        self._attr_name = f"{name} child lock"
-        self._attr_unique_id = f"{self.name}_lock"
+        entity_name = f"{name} child lock"
+        unique_id = f"{entity_name}_lock"
+        self._attr_name = entity_name
+        self._attr_unique_id = unique_id
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, self.unique_id)},
-            connections=(
-                {(device_registry.CONNECTION_NETWORK_MAC, self._mac_address)}
-                if mac_address is not None
-                else None
-            ),
-        )
+        self._attr_device_info = DeviceInfo(identifiers={(DOMAIN, unique_id)})
+        if mac_address is not None:
+            self._attr_device_info["connections"] = {
+                (device_registry.CONNECTION_NETWORK_MAC, mac_address)
+            }
 
     async def async_lock(self, **kwargs) -> None:
         """Locks on the thermostat."""
-        await self._controller.lock()
+        if await self._controller.lock():
+            self.coordinator.async_set_controller_status()
 
     async def async_unlock(self, **kwargs) -> None:
         """Unlocks on the thermostat."""
-        await self._controller.unlock()
+        if await self._controller.unlock():
+            self.coordinator.async_set_controller_status()
 
-    async def async_update(self) -> None:
-        """Updates the state of the climate."""
-        if await self._controller.read_status():
-            self._attr_is_locked = self._controller.locked
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handles the status polled by the coordinator."""
+        state = (self.available, self._controller.locked)
+        if state == self._last_state:
+            return
+        self._last_state = state
+        self._attr_is_locked = self._controller.locked
+        super()._handle_coordinator_update()
 
 
 async def async_setup_entry(
@@ -76,11 +88,9 @@ async def async_setup_entry(
     Returns:
         The value indicates whether the setup succeeded.
     """
-    _LOGGER.info("Setting up BHT1000 child lock.")
-    controller = hass.data[DOMAIN][CONTROLLER][config_entry.data[CONF_HOST]]
+    _LOGGER.debug("Setting up BHT1000 child lock.")
+    coordinator = hass.data[DOMAIN][COORDINATOR][config_entry.data[CONF_HOST]]
     name = config_entry.data[CONF_NAME]
-    mac_address = config_entry.data[CONF_MAC] if CONF_MAC in config_entry.data else None
+    mac_address = config_entry.data.get(CONF_MAC)
 
-    async_add_entities([Bht1000ChildLock(controller, name, mac_address)])
-
-    _LOGGER.info("Setting up BHT1000 child lock completed.")
+    async_add_entities([Bht1000ChildLock(coordinator, name, mac_address)])